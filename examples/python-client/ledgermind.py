@@ -6,6 +6,8 @@ A simple Python client for integrating any AI agent with LedgerMind.
 
 Installation:
     pip install requests
+    pip install orjson         # optional, faster JSON encode/decode
+    pip install "httpx[http2]" # optional, HTTP/2 + AsyncLedgerMindClient
 
 Usage:
     from ledgermind import LedgerMindClient
@@ -23,9 +25,336 @@ Usage:
 """
 
 import requests
-from typing import Optional, Dict, Any, List
-from datetime import datetime
-import uuid
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, Callable, List
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import atexit
+import functools
+import gzip
+import inspect
+import queue
+import re
+import secrets
+import threading
+import time
+import weakref
+import zlib
+
+try:
+    import orjson
+    _dumps = functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    _loads = orjson.loads
+except ImportError:  # optional: stdlib fallback is slower on large payloads
+    import json
+    
+    def _json_default(obj):
+        if hasattr(obj, "tolist"):  # numpy arrays and scalars
+            return obj.tolist()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    
+    _dumps = lambda obj: json.dumps(obj, default=_json_default).encode()
+    _loads = json.loads
+
+try:
+    import numpy as np
+except ImportError:  # optional: only needed for the semantic cache
+    np = None
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # optional: semantic cache falls back to hashed bag-of-words
+    SentenceTransformer = None
+
+try:
+    import httpx
+except ImportError:  # optional: only needed for AsyncLedgerMindClient / HTTP/2
+    httpx = None
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    _HAS_H2 = httpx is not None
+except ImportError:  # optional: without it httpx clients speak HTTP/1.1
+    _HAS_H2 = False
+
+
+if httpx is not None:
+    class _RetryTransport(httpx.HTTPTransport):
+        """
+        HTTPTransport that also retries 502/503/504 responses on idempotent
+        methods, matching the urllib3 Retry used on the requests path.
+        (httpx's own `retries` only covers failed connections.)
+        """
+        
+        RETRY_STATUSES = frozenset({502, 503, 504})
+        
+        def __init__(self, total: int = 3, backoff_factor: float = 0.2, **kwargs):
+            super().__init__(retries=total, **kwargs)
+            self.total = total
+            self.backoff_factor = backoff_factor
+        
+        def handle_request(self, request):
+            for attempt in range(self.total + 1):
+                response = super().handle_request(request)
+                if (
+                    attempt == self.total
+                    or response.status_code not in self.RETRY_STATUSES
+                    or request.method not in Retry.DEFAULT_ALLOWED_METHODS
+                ):
+                    return response
+                response.close()
+                time.sleep(self.backoff_factor * (2 ** attempt))
+
+
+# Request bodies larger than this are gzip-compressed before sending
+COMPRESS_MIN_BYTES = 4096
+
+
+def _encode_body(data: Optional[Any]) -> tuple:
+    """
+    Serialize a request body (unless already JSON bytes), compressing large
+    payloads. Returns (body, headers).
+    """
+    if data is None:
+        return None, None
+    body = data if isinstance(data, bytes) else _dumps(data)
+    if len(body) > COMPRESS_MIN_BYTES:
+        return gzip.compress(body, compresslevel=6), {"Content-Encoding": "gzip"}
+    return body, None
+
+
+def _send_request(session: Any, http2: bool, method: str, url: str, data: Any = None, params: Dict = None) -> Dict:
+    """Send a request through a requests.Session, or an httpx.Client if `http2`."""
+    if params:
+        params = {k: v for k, v in params.items() if v is not None}
+    body, headers = _encode_body(data)
+    if http2:
+        response = session.request(method, url, content=body, params=params, headers=headers)
+    else:
+        response = session.request(method, url, data=body, params=params, headers=headers)
+    response.raise_for_status()
+    return _loads(response.content) if response.content else {}
+
+
+def _safe_summary(obj: Any, max_bytes: int = 2048) -> Any:
+    """
+    JSON-safe, size-bounded summary of a value for input_data.
+    
+    Values that serialize within `max_bytes` are kept as-is; larger ones are
+    cut to a truncated JSON string, and unserializable ones to a truncated repr.
+    """
+    try:
+        encoded = _dumps(obj)
+    except (TypeError, ValueError):
+        return repr(obj)[:max_bytes]
+    if len(encoded) > max_bytes:
+        return encoded[:max_bytes].decode("utf-8", "ignore")
+    return obj
+
+
+def _filter_by_similarity(results: List[List[Dict]], min_similarity: float) -> List[List[Dict]]:
+    """Drop cases below `min_similarity` from per-query result lists in one pass."""
+    flat = [case for cases in results for case in cases]
+    if np is not None:
+        scores = np.fromiter((case["similarity_score"] for case in flat), dtype=np.float64, count=len(flat))
+        keep = (scores >= min_similarity).tolist()
+    else:
+        keep = [case["similarity_score"] >= min_similarity for case in flat]
+    
+    filtered, i = [], 0
+    for cases in results:
+        filtered.append([case for case, k in zip(cases, keep[i:i + len(cases)]) if k])
+        i += len(cases)
+    return filtered
+
+
+def _mkid(prefix: str) -> str:
+    """Generate a unique ID like `trace_<epoch ms>_<8 hex chars>`."""
+    return f"{prefix}_{time.time_ns() // 1_000_000}_{secrets.token_hex(4)}"
+
+
+# Max entries in a client's GET cache (see _cached)
+CACHE_MAX_ENTRIES = 128
+
+
+def _cached(ttl: float = 30):
+    """
+    Cache an idempotent GET method's result per client for `ttl` seconds.
+    
+    Entries live in `self._cache` (an LRU of at most CACHE_MAX_ENTRIES),
+    keyed by method name and arguments, and are dropped by
+    `invalidate_cache()`. Results are stored serialized, so every hit returns
+    a fresh object. Calls with unhashable arguments bypass the cache. Works
+    on sync and async methods.
+    """
+    ttl_ns = int(ttl * 1_000_000_000)
+    
+    def decorator(func):
+        def lookup(self, args, kwargs):
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            try:
+                hit = self._cache.pop(key, None)
+            except TypeError:  # unhashable argument
+                return None, None
+            if hit is None:
+                return key, None
+            if hit[0] <= time.monotonic_ns():
+                return key, None
+            self._cache[key] = hit  # re-insert as most recently used
+            return key, hit
+        
+        def store(self, key, value):
+            if key is None:
+                return value
+            now = time.monotonic_ns()
+            cache = self._cache
+            for k, (expiry, _) in list(cache.items()):
+                if expiry <= now:
+                    cache.pop(k, None)
+            while len(cache) >= CACHE_MAX_ENTRIES:
+                cache.pop(next(iter(cache)), None)
+            cache[key] = (now + ttl_ns, _dumps(value))
+            return value
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                key, hit = lookup(self, args, kwargs)
+                if hit:
+                    return _loads(hit[1])
+                return store(self, key, await func(self, *args, **kwargs))
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key, hit = lookup(self, args, kwargs)
+            if hit:
+                return _loads(hit[1])
+            return store(self, key, func(self, *args, **kwargs))
+        return wrapper
+    return decorator
+
+
+def _decision_event(
+    trace_id: str,
+    agent_name: str,
+    outcome: str,
+    confidence: float,
+    reasoning: str,
+    input_data: Optional[Dict] = None,
+    output_data: Optional[Dict] = None,
+    policy_id: Optional[str] = None,
+    metadata: Optional[Dict] = None
+) -> Dict:
+    """Build the POST /events body for a decision."""
+    step_id = _mkid("step")
+    
+    return {
+        "trace_id": trace_id,
+        "step_id": step_id,
+        "actor_type": "agent",
+        "actor_name": agent_name,
+        "event_type": "decision_made",
+        "outcome": outcome,
+        "confidence": confidence,
+        "reasoning": reasoning,
+        "input_summary": input_data or {},
+        "output_summary": output_data or {},
+        "policy_version_id": policy_id,
+        "metadata": metadata or {}
+    }
+
+
+class _SemanticCache:
+    """
+    Client-side similarity cache for context-keyed calls.
+    
+    Contexts are embedded locally (all-MiniLM-L6-v2 if sentence-transformers
+    is installed, otherwise a hashed bag-of-words) and a lookup returns the
+    stored response of the closest cached context when its cosine similarity
+    is at least `threshold`. Entries only match within the same `scope`
+    (method + remaining arguments). Least recently used entries are evicted
+    beyond `capacity`. Responses are stored serialized, so every hit returns
+    a fresh object.
+    
+    Embeddings live in one preallocated (capacity, DIM) matrix so a lookup is
+    a single matrix-vector product instead of a Python loop.
+    """
+    
+    DIM = 384
+    _model = None
+    _model_lock = threading.Lock()
+    
+    def __init__(self, threshold: float = 0.87, capacity: int = 512):
+        if np is None:
+            raise ImportError("The semantic cache requires numpy: pip install numpy")
+        self.threshold = threshold
+        self.capacity = capacity
+        self._cache_vecs = np.empty((capacity, self.DIM), dtype=np.float32)
+        self._cache_scopes = np.empty(capacity, dtype=np.int64)
+        self._cache_used = np.empty(capacity, dtype=np.int64)
+        self._cache_vals: List[Any] = [None] * capacity
+        self._cache_n = 0
+        self._scope_ids: Dict[tuple, int] = {}
+        self._tick = 0
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def embed(cls, text: str) -> "np.ndarray":
+        """L2-normalized float32 embedding of `text`."""
+        if SentenceTransformer is not None:
+            if cls._model is None:
+                with cls._model_lock:
+                    if cls._model is None:
+                        cls._model = SentenceTransformer("all-MiniLM-L6-v2")
+            return cls._model.encode(text, normalize_embeddings=True).astype(np.float32)
+        
+        # Hashing trick: signed token counts folded into DIM buckets
+        vec = np.zeros(cls.DIM, dtype=np.float32)
+        for token in re.findall(r"\w+", text.lower()):
+            h = zlib.crc32(token.encode())
+            vec[h % cls.DIM] += 1.0 if h & 0x80000000 else -1.0
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+    
+    def get(self, vec: "np.ndarray", scope: tuple) -> Optional[Any]:
+        """Return the cached response closest to `vec`, or None on a miss."""
+        with self._lock:
+            scope_id = self._scope_ids.get(scope)
+            n = self._cache_n
+            if scope_id is None or n == 0:
+                return None
+            sims = self._cache_vecs[:n] @ vec
+            sims[self._cache_scopes[:n] != scope_id] = -np.inf
+            best = int(sims.argmax())
+            if sims[best] < self.threshold:
+                return None
+            self._tick += 1
+            self._cache_used[best] = self._tick
+            encoded = self._cache_vals[best]
+        return _loads(encoded)
+    
+    def put(self, vec: "np.ndarray", scope: tuple, value: Any) -> None:
+        encoded = _dumps(value)
+        with self._lock:
+            if self._cache_n < self.capacity:
+                row = self._cache_n
+                self._cache_n += 1
+            else:
+                row = int(self._cache_used.argmin())
+            self._tick += 1
+            self._cache_vecs[row] = vec
+            self._cache_scopes[row] = self._scope_ids.setdefault(scope, len(self._scope_ids))
+            self._cache_used[row] = self._tick
+            self._cache_vals[row] = encoded
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._cache_n = 0
+            self._cache_vals = [None] * self.capacity
+            self._scope_ids.clear()
 
 
 class LedgerMindClient:
@@ -35,11 +364,30 @@ class LedgerMindClient:
     Works with any AI agent - just import and use!
     """
     
+    # Fixed attribute set: no per-instance __dict__, faster attribute access
+    __slots__ = (
+        "base_url",
+        "headers",
+        "_api_root",
+        "_url_events",
+        "_url_events_batch",
+        "_url_traces",
+        "_session",
+        "_http2",
+        "__weakref__",
+        "_cache",
+        "_sim_cache",
+        "_dispatcher",
+        "_pool",
+    )
+    
     def __init__(
         self, 
         api_key: str, 
         base_url: str = "http://localhost:3000",
-        tenant_id: Optional[str] = None
+        tenant_id: Optional[str] = None,
+        semantic_cache_threshold: Optional[float] = None,
+        http2: bool = False
     ):
         """
         Initialize the LedgerMind client.
@@ -48,7 +396,17 @@ class LedgerMindClient:
             api_key: Your LedgerMind API key
             base_url: API base URL (default: localhost for dev)
             tenant_id: Optional tenant ID for multi-tenant setups
+            semantic_cache_threshold: If set (e.g. 0.87, or 0.95 for tight
+                matches), find_similar/get_recommendation answer locally
+                when a previous context is at least this similar
+            http2: Send through httpx over HTTP/2 instead of requests
+                (needs `pip install "httpx[http2]"`). Errors are then
+                httpx exceptions (httpx.HTTPStatusError, httpx.HTTPError)
+                rather than requests ones.
         """
+        if http2 and not _HAS_H2:
+            raise ImportError('http2=True requires httpx with HTTP/2 support: pip install "httpx[http2]"')
+        
         self.base_url = base_url.rstrip('/')
         self.headers = {
             "Authorization": f"Bearer {api_key}",
@@ -56,13 +414,103 @@ class LedgerMindClient:
         }
         if tenant_id:
             self.headers["x-tenant-id"] = tenant_id
+        
+        # Prebuilt URLs so hot paths skip per-call string formatting
+        self._api_root = f"{self.base_url}/api"
+        self._url_events = self._api_root + "/events"
+        self._url_events_batch = self._api_root + "/events/batch"
+        self._url_traces = self._api_root + "/traces"
+        
+        # One pooled session for the client's lifetime so back-to-back calls
+        # reuse the same keep-alive connection instead of re-handshaking.
+        # With http2=True, concurrent calls (background dispatch,
+        # recommend_with_similar) multiplex over a single HTTP/2 connection.
+        # Both backends retry the same failures and, like requests, never
+        # time out.
+        self._http2 = http2
+        if self._http2:
+            self._session = httpx.Client(
+                headers=self.headers,
+                timeout=None,
+                transport=_RetryTransport(
+                    total=3,
+                    backoff_factor=0.2,
+                    http2=True,
+                    limits=httpx.Limits(max_keepalive_connections=20)
+                )
+            )
+        else:
+            self._session = requests.Session()
+            self._session.headers.update(self.headers)
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=50,
+                max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+            )
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+        
+        # TTL cache for idempotent GETs (see _cached)
+        self._cache: Dict[tuple, tuple] = {}
+        
+        # Opt-in similarity cache for context-keyed calls
+        self._sim_cache = (
+            _SemanticCache(semantic_cache_threshold)
+            if semantic_cache_threshold is not None else None
+        )
+        
+        # Sends `background=True` calls from a worker thread (started lazily).
+        # The worker only holds the session, so an unclosed client can still be
+        # collected; its queued calls are then sent and the worker stopped.
+        self._dispatcher = _AsyncDispatcher(
+            functools.partial(_send_request, self._session, self._http2), self._api_root
+        )
+        weakref.finalize(self, self._dispatcher.close).atexit = False
+        
+        # Runs independent calls in parallel (threads start on first use)
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ledgermind")
     
-    def _request(self, method: str, endpoint: str, data: Dict = None) -> Dict:
-        """Make an API request."""
-        url = f"{self.base_url}/api{endpoint}"
-        response = requests.request(method, url, headers=self.headers, json=data)
-        response.raise_for_status()
-        return response.json() if response.text else {}
+    def close(self) -> None:
+        """Send pending background calls, then release pooled connections."""
+        self._dispatcher.close()
+        self._pool.shutdown(wait=True)
+        self._session.close()
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued background calls to be sent.
+        
+        Returns:
+            False if `timeout` expired first, or if any background call was
+            dropped (queue full) or failed since the last flush; see
+            `background_stats` for details
+        """
+        return self._dispatcher.flush(timeout)
+    
+    @property
+    def background_stats(self) -> Dict[str, Any]:
+        """Counts for `background=True` calls: queued, dropped, failed, and the last error."""
+        return self._dispatcher.stats()
+    
+    def invalidate_cache(self) -> None:
+        """Drop cached policies, patterns, override rates and similarity results."""
+        self._cache.clear()
+        if self._sim_cache is not None:
+            self._sim_cache.clear()
+    
+    def __enter__(self) -> "LedgerMindClient":
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+    
+    def _request(self, method: str, endpoint: str, data: Dict = None, params: Dict = None) -> Dict:
+        """Make an API request. `None` query params are dropped."""
+        return self._send(method, self._api_root + endpoint, data, params)
+    
+    def _send(self, method: str, url: str, data: Dict = None, params: Dict = None) -> Dict:
+        """Make a request to a full URL."""
+        return _send_request(self._session, self._http2, method, url, data, params)
     
     # =========================================================================
     # TRACES - Track complete decision workflows
@@ -71,7 +519,8 @@ class LedgerMindClient:
     def start_trace(
         self, 
         workflow_name: str, 
-        metadata: Optional[Dict] = None
+        metadata: Optional[Dict] = None,
+        background: bool = False
     ) -> str:
         """
         Start a new decision trace.
@@ -79,38 +528,46 @@ class LedgerMindClient:
         Args:
             workflow_name: Name of the workflow (e.g., "loan_approval")
             metadata: Optional metadata dict
+            background: Queue the call and return immediately
             
         Returns:
             trace_id: Unique identifier for this trace
         """
-        trace_id = f"trace_{int(datetime.now().timestamp() * 1000)}_{uuid.uuid4().hex[:8]}"
+        trace_id = _mkid("trace")
         
-        self._request("POST", "/traces", {
+        body = {
             "trace_id": trace_id,
             "workflow_name": workflow_name,
             "metadata": metadata or {}
-        })
+        }
+        if background:
+            self._dispatcher.put("POST", "/traces", body)
+        else:
+            self._send("POST", self._url_traces, body)
         
         return trace_id
     
-    def end_trace(self, trace_id: str, final_outcome: str) -> None:
+    def end_trace(self, trace_id: str, final_outcome: str, background: bool = False) -> None:
         """
         Complete a trace with the final outcome.
         
         Args:
             trace_id: The trace to complete
             final_outcome: Final decision (approved/rejected/escalated/etc)
+            background: Queue the call and return immediately
         """
-        self._request("PATCH", f"/traces/{trace_id}", {
-            "final_outcome": final_outcome
-        })
+        body = {"final_outcome": final_outcome}
+        if background:
+            self._dispatcher.put("PATCH", f"/traces/{trace_id}", body)
+        else:
+            self._request("PATCH", f"/traces/{trace_id}", body)
     
     def get_traces(self, limit: int = 50, workflow_name: Optional[str] = None) -> List[Dict]:
         """Get recent traces."""
-        params = f"?limit={limit}"
-        if workflow_name:
-            params += f"&workflow_name={workflow_name}"
-        return self._request("GET", f"/traces{params}")
+        return self._request("GET", "/traces", params={
+            "limit": limit,
+            "workflow_name": workflow_name
+        })
     
     # =========================================================================
     # DECISIONS - Log individual agent decisions
@@ -126,8 +583,9 @@ class LedgerMindClient:
         input_data: Optional[Dict] = None,
         output_data: Optional[Dict] = None,
         policy_id: Optional[str] = None,
-        metadata: Optional[Dict] = None
-    ) -> Dict:
+        metadata: Optional[Dict] = None,
+        background: bool = False
+    ) -> Optional[Dict]:
         """
         Log an AI agent decision.
         
@@ -141,25 +599,69 @@ class LedgerMindClient:
             output_data: What the agent produced
             policy_id: Optional policy that guided this decision
             metadata: Additional context
+            background: Queue the event (sent batched) and return immediately
             
         Returns:
-            The created event
+            The created event, or None when sent in the background
+        """
+        event = _decision_event(
+            trace_id, agent_name, outcome, confidence, reasoning,
+            input_data, output_data, policy_id, metadata
+        )
+        if background:
+            self._dispatcher.put("POST", "/events", event)
+            return None
+        return self._send("POST", self._url_events, event)
+    
+    def log_final_decision(
+        self,
+        trace_id: str,
+        agent_name: str,
+        outcome: str,
+        confidence: float,
+        reasoning: str,
+        input_data: Optional[Dict] = None,
+        output_data: Optional[Dict] = None,
+        policy_id: Optional[str] = None,
+        metadata: Optional[Dict] = None,
+        final_outcome: Optional[str] = None,
+        background: bool = False
+    ) -> Optional[Dict]:
         """
-        step_id = f"step_{int(datetime.now().timestamp() * 1000)}_{uuid.uuid4().hex[:8]}"
+        Log the last decision of a trace and complete the trace in one call.
         
-        return self._request("POST", "/events", {
-            "trace_id": trace_id,
-            "step_id": step_id,
-            "actor_type": "agent",
-            "actor_name": agent_name,
-            "event_type": "decision_made",
-            "outcome": outcome,
-            "confidence": confidence,
-            "reasoning": reasoning,
-            "input_summary": input_data or {},
-            "output_summary": output_data or {},
-            "policy_version_id": policy_id,
-            "metadata": metadata or {}
+        Equivalent to log_decision() followed by end_trace(), in a single
+        request; raises (404) without storing the event if the trace doesn't
+        exist. In the background the event is likewise not stored, and the
+        call counts as failed (see `background_stats`).
+        Takes the same arguments as log_decision, plus:
+        
+        Args:
+            final_outcome: Trace outcome, if different from `outcome`
+        """
+        event = _decision_event(
+            trace_id, agent_name, outcome, confidence, reasoning,
+            input_data, output_data, policy_id, metadata
+        )
+        event["end_trace"] = True
+        event["final_outcome"] = final_outcome or outcome
+        if background:
+            self._dispatcher.put("POST", "/events", event)
+            return None
+        return self._send("POST", self._url_events, event)
+    
+    def log_decisions(self, events: List[Dict]) -> List[Dict]:
+        """
+        Log many decisions in one request.
+        
+        Args:
+            events: List of dicts with the same keys as log_decision's arguments
+            
+        Returns:
+            The created events
+        """
+        return self._send("POST", self._url_events_batch, {
+            "events": [_decision_event(**event) for event in events]
         })
     
     # =========================================================================
@@ -185,12 +687,74 @@ class LedgerMindClient:
         Returns:
             List of similar past decisions with similarity scores
         """
-        return self._request("POST", "/similarity/query", {
+        if self._sim_cache is not None:
+            vec = self._sim_cache.embed(context)
+            scope = ("find_similar", limit, min_similarity, workflow_name)
+            hit = self._sim_cache.get(vec, scope)
+            if hit is not None:
+                return hit
+        
+        result = self._request("POST", "/similarity/query", {
             "input_context": context,
             "limit": limit,
             "min_similarity": min_similarity,
             "workflow_name": workflow_name
         })
+        
+        if self._sim_cache is not None:
+            self._sim_cache.put(vec, scope, result)
+        return result
+    
+    def find_similar_batch(
+        self,
+        contexts: List[str],
+        limit: int = 5,
+        min_similarity: float = 0.7,
+        workflow_name: Optional[str] = None
+    ) -> List[List[Dict]]:
+        """
+        Find similar past decisions for many contexts in one request.
+        
+        The server embeds all contexts in a single batch and returns raw
+        vector matches; `min_similarity` is applied locally.
+        
+        Args:
+            contexts: Descriptions of the situations to look up
+            limit: Max results per context
+            min_similarity: Minimum similarity threshold (0-1)
+            workflow_name: Optional filter by workflow
+            
+        Returns:
+            One list of similar decisions per context, in input order
+        """
+        response = self._request("POST", "/similarity/query/batch", {
+            "input_contexts": contexts,
+            "limit": limit,
+            "workflow_name": workflow_name
+        })
+        return _filter_by_similarity(response["results"], min_similarity)
+    
+    def find_similar_vec(
+        self,
+        vecs: "np.ndarray",
+        limit: int = 5,
+        min_similarity: float = 0.7,
+        workflow_name: Optional[str] = None
+    ) -> List[List[Dict]]:
+        """
+        Like find_similar_batch, but with precomputed query embeddings.
+        
+        Skips server-side embedding entirely. `vecs` is an (n, dim) array
+        whose dim matches the server's embedding model.
+        """
+        if np is None:
+            raise ImportError("find_similar_vec requires numpy: pip install numpy")
+        response = self._request("POST", "/similarity/query/batch", {
+            "query_embeddings": np.ascontiguousarray(vecs, dtype=np.float32),
+            "limit": limit,
+            "workflow_name": workflow_name
+        })
+        return _filter_by_similarity(response["results"], min_similarity)
     
     # =========================================================================
     # AI FEATURES - Intelligence layer
@@ -207,18 +771,50 @@ class LedgerMindClient:
         Returns:
             Recommendation with reasoning and similar cases
         """
-        return self._request("POST", "/ai/recommend", {
+        if self._sim_cache is not None:
+            vec = self._sim_cache.embed(context)
+            scope = ("get_recommendation", workflow_name)
+            hit = self._sim_cache.get(vec, scope)
+            if hit is not None:
+                return hit
+        
+        result = self._request("POST", "/ai/recommend", {
             "context": context,
             "workflow_name": workflow_name
         })
+        
+        if self._sim_cache is not None:
+            self._sim_cache.put(vec, scope, result)
+        return result
+    
+    def recommend_with_similar(
+        self,
+        context: str,
+        limit: int = 5,
+        min_similarity: float = 0.7,
+        workflow_name: Optional[str] = None
+    ) -> Dict:
+        """
+        Get a recommendation and similar past decisions in parallel.
+        
+        Same arguments as find_similar. Both requests are in flight at once,
+        so this takes as long as the slower of the two rather than their sum.
+        
+        Returns:
+            {"similar": <find_similar result>, "recommendation": <get_recommendation result>}
+        """
+        similar = self._pool.submit(self.find_similar, context, limit, min_similarity, workflow_name)
+        recommendation = self._pool.submit(self.get_recommendation, context, workflow_name)
+        return {"similar": similar.result(), "recommendation": recommendation.result()}
     
+    @_cached(ttl=30)
     def detect_patterns(self, days: int = 7) -> Dict:
         """Detect patterns in recent decisions."""
-        return self._request("GET", f"/ai/patterns?days={days}")
+        return self._request("GET", "/ai/patterns", params={"days": days})
     
     def generate_audit_report(self, days: int = 30) -> Dict:
         """Generate a compliance audit report."""
-        return self._request("GET", f"/ai/audit-report?days={days}")
+        return self._request("GET", "/ai/audit-report", params={"days": days})
     
     def ask(self, question: str) -> Dict:
         """
@@ -238,6 +834,7 @@ class LedgerMindClient:
     # POLICIES - Manage decision policies
     # =========================================================================
     
+    @_cached(ttl=30)
     def get_policies(self) -> List[Dict]:
         """Get all active policies."""
         return self._request("GET", "/policies")
@@ -258,12 +855,14 @@ class LedgerMindClient:
             version: Version number
             metadata: Additional metadata
         """
-        return self._request("POST", "/policies", {
+        policy = self._request("POST", "/policies", {
             "policy_name": name,
             "version": version,
             "content": rules,
             "metadata": metadata or {}
         })
+        self.invalidate_cache()
+        return policy
     
     # =========================================================================
     # OVERRIDES - Human corrections
@@ -287,33 +886,708 @@ class LedgerMindClient:
             new_outcome: The corrected outcome
             reason: Why the override was made
         """
-        return self._request("POST", "/overrides", {
+        override = self._request("POST", "/overrides", {
             "original_event_id": event_id,
             "trace_id": trace_id,
             "actor_name": reviewer_name,
             "new_outcome": new_outcome,
             "reason": reason
         })
+        self.invalidate_cache()
+        return override
     
     def get_overrides(self, limit: int = 50) -> List[Dict]:
         """Get recent human overrides."""
-        return self._request("GET", f"/overrides?limit={limit}")
+        return self._request("GET", "/overrides", params={"limit": limit})
     
+    @_cached(ttl=30)
     def get_override_rate(self, workflow_name: Optional[str] = None) -> float:
         """Get the override rate (% of decisions corrected by humans)."""
-        params = f"?workflow_name={workflow_name}" if workflow_name else ""
-        result = self._request("GET", f"/overrides/rate{params}")
+        result = self._request("GET", "/overrides/rate", params={
+            "workflow_name": workflow_name
+        })
         return result.get("override_rate", 0)
 
 
+# =============================================================================
+# ASYNC CLIENT - Same API, awaitable, for concurrent logging
+# =============================================================================
+
+class AsyncLedgerMindClient:
+    """
+    Async twin of LedgerMindClient built on httpx.AsyncClient.
+    
+    Lets agents fire many calls concurrently:
+    
+        async with AsyncLedgerMindClient(api_key="...") as client:
+            await asyncio.gather(*(client.log_decision(...) for ...))
+    
+    Requires: pip install httpx (the [http2] extra enables HTTP/2)
+    """
+    
+    def __init__(
+        self, 
+        api_key: str, 
+        base_url: str = "http://localhost:3000",
+        tenant_id: Optional[str] = None,
+        semantic_cache_threshold: Optional[float] = None,
+        http2: bool = True
+    ):
+        if httpx is None:
+            raise ImportError('AsyncLedgerMindClient requires httpx: pip install httpx')
+        
+        self.base_url = base_url.rstrip('/')
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+        if tenant_id:
+            self.headers["x-tenant-id"] = tenant_id
+        
+        # Single long-lived client; never construct one per call.
+        self._client = httpx.AsyncClient(
+            base_url=f"{self.base_url}/api",
+            headers=self.headers,
+            http2=http2 and _HAS_H2,  # HTTP/1.1 if the h2 extra is missing
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        )
+        
+        # TTL cache for idempotent GETs (see _cached)
+        self._cache: Dict[tuple, tuple] = {}
+        
+        # Opt-in similarity cache for context-keyed calls
+        self._sim_cache = (
+            _SemanticCache(semantic_cache_threshold)
+            if semantic_cache_threshold is not None else None
+        )
+    
+    async def aclose(self) -> None:
+        """Release pooled connections."""
+        await self._client.aclose()
+    
+    def invalidate_cache(self) -> None:
+        """Drop cached policies, patterns, override rates and similarity results."""
+        self._cache.clear()
+        if self._sim_cache is not None:
+            self._sim_cache.clear()
+    
+    async def __aenter__(self) -> "AsyncLedgerMindClient":
+        return self
+    
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+    
+    async def _request(self, method: str, endpoint: str, data: Dict = None, params: Dict = None) -> Dict:
+        """Make an API request. `None` query params are dropped."""
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+        body, headers = _encode_body(data)
+        response = await self._client.request(method, endpoint, content=body, params=params, headers=headers)
+        response.raise_for_status()
+        return _loads(response.content) if response.content else {}
+    
+    # =========================================================================
+    # TRACES
+    # =========================================================================
+    
+    async def start_trace(self, workflow_name: str, metadata: Optional[Dict] = None) -> str:
+        """Start a new decision trace. Returns the trace_id."""
+        trace_id = _mkid("trace")
+        
+        await self._request("POST", "/traces", {
+            "trace_id": trace_id,
+            "workflow_name": workflow_name,
+            "metadata": metadata or {}
+        })
+        
+        return trace_id
+    
+    async def end_trace(self, trace_id: str, final_outcome: str) -> None:
+        """Complete a trace with the final outcome."""
+        await self._request("PATCH", f"/traces/{trace_id}", {
+            "final_outcome": final_outcome
+        })
+    
+    async def get_traces(self, limit: int = 50, workflow_name: Optional[str] = None) -> List[Dict]:
+        """Get recent traces."""
+        return await self._request("GET", "/traces", params={
+            "limit": limit,
+            "workflow_name": workflow_name
+        })
+    
+    # =========================================================================
+    # DECISIONS
+    # =========================================================================
+    
+    async def log_decision(
+        self,
+        trace_id: str,
+        agent_name: str,
+        outcome: str,
+        confidence: float,
+        reasoning: str,
+        input_data: Optional[Dict] = None,
+        output_data: Optional[Dict] = None,
+        policy_id: Optional[str] = None,
+        metadata: Optional[Dict] = None
+    ) -> Dict:
+        """Log an AI agent decision. See LedgerMindClient.log_decision."""
+        return await self._request("POST", "/events", _decision_event(
+            trace_id, agent_name, outcome, confidence, reasoning,
+            input_data, output_data, policy_id, metadata
+        ))
+    
+    async def log_final_decision(
+        self,
+        trace_id: str,
+        agent_name: str,
+        outcome: str,
+        confidence: float,
+        reasoning: str,
+        input_data: Optional[Dict] = None,
+        output_data: Optional[Dict] = None,
+        policy_id: Optional[str] = None,
+        metadata: Optional[Dict] = None,
+        final_outcome: Optional[str] = None
+    ) -> Dict:
+        """Log a trace's last decision and complete it. See LedgerMindClient.log_final_decision."""
+        event = _decision_event(
+            trace_id, agent_name, outcome, confidence, reasoning,
+            input_data, output_data, policy_id, metadata
+        )
+        event["end_trace"] = True
+        event["final_outcome"] = final_outcome or outcome
+        return await self._request("POST", "/events", event)
+    
+    async def log_decisions(self, events: List[Dict]) -> List[Dict]:
+        """Log many decisions in one request. See LedgerMindClient.log_decisions."""
+        return await self._request("POST", "/events/batch", {
+            "events": [_decision_event(**event) for event in events]
+        })
+    
+    # =========================================================================
+    # SIMILARITY
+    # =========================================================================
+    
+    async def find_similar(
+        self, 
+        context: str, 
+        limit: int = 5,
+        min_similarity: float = 0.7,
+        workflow_name: Optional[str] = None
+    ) -> List[Dict]:
+        """Find similar past decisions using semantic search."""
+        if self._sim_cache is not None:
+            # Embedding (and the first-use model load) is CPU-bound; keep it off the event loop
+            vec = await asyncio.get_running_loop().run_in_executor(None, self._sim_cache.embed, context)
+            scope = ("find_similar", limit, min_similarity, workflow_name)
+            hit = self._sim_cache.get(vec, scope)
+            if hit is not None:
+                return hit
+        
+        result = await self._request("POST", "/similarity/query", {
+            "input_context": context,
+            "limit": limit,
+            "min_similarity": min_similarity,
+            "workflow_name": workflow_name
+        })
+        
+        if self._sim_cache is not None:
+            self._sim_cache.put(vec, scope, result)
+        return result
+    
+    async def find_similar_batch(
+        self,
+        contexts: List[str],
+        limit: int = 5,
+        min_similarity: float = 0.7,
+        workflow_name: Optional[str] = None
+    ) -> List[List[Dict]]:
+        """Find similar past decisions for many contexts in one request."""
+        response = await self._request("POST", "/similarity/query/batch", {
+            "input_contexts": contexts,
+            "limit": limit,
+            "workflow_name": workflow_name
+        })
+        return _filter_by_similarity(response["results"], min_similarity)
+    
+    async def find_similar_vec(
+        self,
+        vecs: "np.ndarray",
+        limit: int = 5,
+        min_similarity: float = 0.7,
+        workflow_name: Optional[str] = None
+    ) -> List[List[Dict]]:
+        """Like find_similar_batch, but with precomputed query embeddings."""
+        if np is None:
+            raise ImportError("find_similar_vec requires numpy: pip install numpy")
+        response = await self._request("POST", "/similarity/query/batch", {
+            "query_embeddings": np.ascontiguousarray(vecs, dtype=np.float32),
+            "limit": limit,
+            "workflow_name": workflow_name
+        })
+        return _filter_by_similarity(response["results"], min_similarity)
+    
+    # =========================================================================
+    # AI FEATURES
+    # =========================================================================
+    
+    async def get_recommendation(self, context: str, workflow_name: Optional[str] = None) -> Dict:
+        """Get AI recommendation for a decision."""
+        if self._sim_cache is not None:
+            # Embedding (and the first-use model load) is CPU-bound; keep it off the event loop
+            vec = await asyncio.get_running_loop().run_in_executor(None, self._sim_cache.embed, context)
+            scope = ("get_recommendation", workflow_name)
+            hit = self._sim_cache.get(vec, scope)
+            if hit is not None:
+                return hit
+        
+        result = await self._request("POST", "/ai/recommend", {
+            "context": context,
+            "workflow_name": workflow_name
+        })
+        
+        if self._sim_cache is not None:
+            self._sim_cache.put(vec, scope, result)
+        return result
+    
+    async def recommend_with_similar(
+        self,
+        context: str,
+        limit: int = 5,
+        min_similarity: float = 0.7,
+        workflow_name: Optional[str] = None
+    ) -> Dict:
+        """Get a recommendation and similar past decisions concurrently."""
+        similar, recommendation = await asyncio.gather(
+            self.find_similar(context, limit, min_similarity, workflow_name),
+            self.get_recommendation(context, workflow_name)
+        )
+        return {"similar": similar, "recommendation": recommendation}
+    
+    @_cached(ttl=30)
+    async def detect_patterns(self, days: int = 7) -> Dict:
+        """Detect patterns in recent decisions."""
+        return await self._request("GET", "/ai/patterns", params={"days": days})
+    
+    async def generate_audit_report(self, days: int = 30) -> Dict:
+        """Generate a compliance audit report."""
+        return await self._request("GET", "/ai/audit-report", params={"days": days})
+    
+    async def ask(self, question: str) -> Dict:
+        """Ask a natural language question about decisions."""
+        return await self._request("POST", "/ai/parse-query", {
+            "query": question
+        })
+    
+    # =========================================================================
+    # POLICIES
+    # =========================================================================
+    
+    @_cached(ttl=30)
+    async def get_policies(self) -> List[Dict]:
+        """Get all active policies."""
+        return await self._request("GET", "/policies")
+    
+    async def create_policy(
+        self,
+        name: str,
+        rules: Dict,
+        version: int = 1,
+        metadata: Optional[Dict] = None
+    ) -> Dict:
+        """Create a new policy."""
+        policy = await self._request("POST", "/policies", {
+            "policy_name": name,
+            "version": version,
+            "content": rules,
+            "metadata": metadata or {}
+        })
+        self.invalidate_cache()
+        return policy
+    
+    # =========================================================================
+    # OVERRIDES
+    # =========================================================================
+    
+    async def record_override(
+        self,
+        event_id: str,
+        trace_id: str,
+        reviewer_name: str,
+        new_outcome: str,
+        reason: str
+    ) -> Dict:
+        """Record a human override of an AI decision."""
+        override = await self._request("POST", "/overrides", {
+            "original_event_id": event_id,
+            "trace_id": trace_id,
+            "actor_name": reviewer_name,
+            "new_outcome": new_outcome,
+            "reason": reason
+        })
+        self.invalidate_cache()
+        return override
+    
+    async def get_overrides(self, limit: int = 50) -> List[Dict]:
+        """Get recent human overrides."""
+        return await self._request("GET", "/overrides", params={"limit": limit})
+    
+    @_cached(ttl=30)
+    async def get_override_rate(self, workflow_name: Optional[str] = None) -> float:
+        """Get the override rate (% of decisions corrected by humans)."""
+        result = await self._request("GET", "/overrides/rate", params={
+            "workflow_name": workflow_name
+        })
+        return result.get("override_rate", 0)
+
+
+# =============================================================================
+# BUFFERED LOGGING - Coalesce many decisions into one request
+# =============================================================================
+
+class _DecisionColumns:
+    """
+    Column-oriented storage for buffered decisions.
+    
+    Keeps one list/array per field instead of one dict per decision:
+    confidences are packed doubles, outcomes are small category codes, and
+    the rarely-set optional fields are stored sparsely by row.
+    """
+    
+    OUTCOMES = ["approved", "rejected", "escalated", "pending", "error"]
+    
+    def __init__(self):
+        self.trace_ids: List[str] = []
+        self.agent_names: List[str] = []
+        self.outcomes = array("H")
+        self.confidences = array("d")
+        self.reasonings: List[str] = []
+        self.extras: Dict[int, Dict] = {}
+        self._outcome_names = list(self.OUTCOMES)
+        self._outcome_codes = {name: i for i, name in enumerate(self._outcome_names)}
+    
+    def __len__(self) -> int:
+        return len(self.trace_ids)
+    
+    def append(self, trace_id: str, agent_name: str, outcome: str, confidence: float, reasoning: str, extras: Dict) -> None:
+        # Convert everything that can fail before touching any column, so a
+        # bad row can't leave the columns out of step
+        confidence = float(confidence)
+        code = self._outcome_codes.get(outcome)
+        if code is None:
+            code = self._outcome_codes[outcome] = len(self._outcome_names)
+            self._outcome_names.append(outcome)
+        row = len(self.trace_ids)
+        self.outcomes.append(code)
+        self.confidences.append(confidence)
+        self.trace_ids.append(trace_id)
+        self.agent_names.append(agent_name)
+        self.reasonings.append(reasoning)
+        if extras:
+            self.extras[row] = extras
+    
+    def to_events(self) -> List[Dict]:
+        """Rebuild log_decision-style argument dicts for log_decisions()."""
+        names = self._outcome_names
+        return [
+            dict(
+                trace_id=trace_id,
+                agent_name=agent_name,
+                outcome=names[code],
+                confidence=confidence,
+                reasoning=reasoning,
+                **self.extras.get(i, {})
+            )
+            for i, (trace_id, agent_name, code, confidence, reasoning) in enumerate(zip(
+                self.trace_ids, self.agent_names, self.outcomes, self.confidences, self.reasonings
+            ))
+        ]
+    
+    def extend(self, other: "_DecisionColumns") -> None:
+        """Append every row of `other`, re-encoding its outcomes."""
+        for event in other.to_events():
+            self.append(
+                event.pop("trace_id"), event.pop("agent_name"), event.pop("outcome"),
+                event.pop("confidence"), event.pop("reasoning"), event
+            )
+
+
+class BufferedLogger:
+    """
+    Buffer decisions client-side and send them in batches.
+    
+    Flushes when the buffer reaches `flush_size`, every `flush_interval`
+    seconds (if set), and on exit. Buffered decisions are held column-wise
+    (see _DecisionColumns) so large buffers stay small in memory.
+    
+    Usage:
+        with BufferedLogger(client, flush_size=64) as logger:
+            for item in items:
+                logger.log(trace_id, "MyAgent", "approved", 0.9, "ok")
+    """
+    
+    # Optional log_decision arguments that can be buffered
+    EXTRA_ARGS = frozenset(inspect.signature(_decision_event).parameters) - {
+        "trace_id", "agent_name", "outcome", "confidence", "reasoning"
+    }
+    
+    def __init__(
+        self,
+        client: LedgerMindClient,
+        flush_size: int = 64,
+        flush_interval: Optional[float] = None
+    ):
+        self.client = client
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._buffer = _DecisionColumns()
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._closed = False
+    
+    def __enter__(self) -> "BufferedLogger":
+        with self._lock:
+            self._closed = False
+        self._schedule()
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        # Stop the timer (and wait out a tick in progress) before the last flush
+        with self._lock:
+            self._closed = True
+            timer, self._timer = self._timer, None
+        if timer:
+            timer.cancel()
+            if timer is not threading.current_thread():
+                timer.join()
+        try:
+            self.flush()
+        except Exception:
+            # Don't mask the exception already leaving the with block
+            if exc[0] is None:
+                raise
+    
+    def log(self, trace_id: str, agent_name: str, outcome: str, confidence: float, reasoning: str, **kwargs) -> None:
+        """Queue a decision. Accepts the same arguments as log_decision."""
+        unknown = kwargs.keys() - self.EXTRA_ARGS
+        if unknown:
+            raise TypeError(f"log() got unexpected keyword arguments: {', '.join(sorted(unknown))}")
+        with self._lock:
+            self._buffer.append(trace_id, agent_name, outcome, confidence, reasoning, kwargs)
+            full = len(self._buffer) >= self.flush_size
+        if full:
+            self.flush()
+    
+    def flush(self) -> List[Dict]:
+        """
+        Send all buffered decisions now.
+        
+        If the request fails the decisions are put back (ahead of anything
+        logged meanwhile) and the error is re-raised.
+        """
+        with self._lock:
+            columns, self._buffer = self._buffer, _DecisionColumns()
+        if not columns:
+            return []
+        try:
+            return self.client.log_decisions(columns.to_events())
+        except Exception:
+            with self._lock:
+                columns.extend(self._buffer)
+                self._buffer = columns
+            raise
+    
+    def _schedule(self) -> None:
+        if not self.flush_interval:
+            return
+        with self._lock:
+            if self._closed:
+                return
+            self._timer = threading.Timer(self.flush_interval, self._tick)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def _tick(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._schedule()
+
+
+# =============================================================================
+# BACKGROUND DISPATCH - Fire-and-forget calls off the caller's thread
+# =============================================================================
+
+# Dispatchers still running at interpreter exit get a last flush. Held
+# weakly so closed dispatchers drop out; a running one is kept alive by its
+# worker thread until it's closed.
+_live_dispatchers: "weakref.WeakSet[_AsyncDispatcher]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_dispatchers_at_exit() -> None:
+    for dispatcher in list(_live_dispatchers):
+        dispatcher.flush(5.0)
+
+
+class _AsyncDispatcher:
+    """
+    Queue of (method, endpoint, body) calls sent by a daemon thread.
+    
+    Calls go out through `send(method, url, body)`, which is bound to the
+    client's session rather than the client, so a running worker never keeps
+    its client alive.
+    
+    Each drain of up to `batch_size` items sends trace creations first, then
+    all queued decision events as one POST /events/batch, then everything
+    else in order. When the queue is full, calls are dropped (and counted)
+    unless `block` is set. `close()` sends what is queued, stops the thread
+    and rejects further calls.
+    
+    Bodies are serialized in put(), so the caller can mutate its objects
+    afterwards without changing what gets sent.
+    """
+    
+    _STOP = object()
+    
+    def __init__(
+        self,
+        send: Callable[..., Dict],
+        api_root: str,
+        maxsize: int = 10_000,
+        batch_size: int = 64,
+        block: bool = False
+    ):
+        self._send_request = send
+        self._api_root = api_root
+        self.batch_size = batch_size
+        self.block = block
+        self.dropped = 0
+        self.failed = 0
+        self.last_error: Optional[Exception] = None
+        self._reported = (0, 0)
+        self._closed = False
+        self._q: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def put(self, method: str, endpoint: str, body: Dict) -> None:
+        if self._closed:
+            raise RuntimeError("LedgerMindClient is closed")
+        if self._thread is None:
+            self._start()
+        try:
+            self._q.put((method, endpoint, _dumps(body)), block=self.block)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every queued call has been sent (or `timeout` expires).
+        
+        Returns False on timeout, or if any call was dropped or failed since
+        the previous flush.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._q.all_tasks_done:
+            while self._q.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._q.all_tasks_done.wait(remaining)
+        with self._lock:
+            counts = (self.dropped, self.failed)
+            clean = counts == self._reported
+            self._reported = counts
+        return clean
+    
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Send queued calls, then stop the worker thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        _live_dispatchers.discard(self)
+        if self._thread is not None:
+            self._q.put(self._STOP)
+            self._thread.join(timeout)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queued": self._q.unfinished_tasks,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "last_error": self.last_error,
+        }
+    
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="ledgermind-dispatcher", daemon=True)
+            self._thread.start()
+            _live_dispatchers.add(self)
+    
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            items = [self._q.get()]
+            while len(items) < self.batch_size and items[-1] is not self._STOP:
+                try:
+                    items.append(self._q.get_nowait())
+                except queue.Empty:
+                    break
+            stop = items[-1] is self._STOP
+            try:
+                self._send(items[:-1] if stop else items)
+            finally:
+                for _ in items:
+                    self._q.task_done()
+    
+    def _send(self, items: List[tuple]) -> None:
+        traces = [item for item in items if item[:2] == ("POST", "/traces")]
+        events = [item[2] for item in items if item[:2] == ("POST", "/events")]
+        rest = [item for item in items if item[:2] not in (("POST", "/traces"), ("POST", "/events"))]
+        
+        for method, endpoint, body in traces:
+            self._call(1, method, endpoint, body)
+        if events:
+            body = b'{"events":[' + b",".join(events) + b"]}"
+            created = self._call(len(events), "POST", "/events/batch", body)
+            # end_trace events whose trace doesn't exist are skipped by the server
+            missing = [e["trace_id"] for e in created or [] if e.get("trace_completed") is False]
+            if missing:
+                with self._lock:
+                    self.failed += len(missing)
+                    self.last_error = LookupError(f"Trace not found: {', '.join(missing)}")
+        for method, endpoint, body in rest:
+            self._call(1, method, endpoint, body)
+    
+    def _call(self, count: int, method: str, endpoint: str, body: bytes) -> Any:
+        try:
+            return self._send_request(method, self._api_root + endpoint, body)
+        except Exception as error:
+            with self._lock:
+                self.failed += count
+                self.last_error = error
+            return None
+
+
 # =============================================================================
 # DECORATOR - Wrap any function to auto-log decisions
 # =============================================================================
 
-def track_decision(client: LedgerMindClient, agent_name: str, workflow_name: str):
+def track_decision(client: LedgerMindClient, agent_name: str, workflow_name: str, background: bool = False):
     """
     Decorator to automatically track decisions from any function.
     
+    With `background=True` the trace and decision are queued and sent from a
+    worker thread, so the decorated function returns as soon as it's done.
+    Call `client.flush()` before exiting to make sure everything was sent.
+    
     Usage:
         @track_decision(client, "MyAgent", "my_workflow")
         def my_decision_function(input_data):
@@ -324,40 +1598,47 @@ def track_decision(client: LedgerMindClient, agent_name: str, workflow_name: str
                 "reasoning": "Looks good"
             }
     """
+    # Bind client methods once instead of on every call
+    start = client.start_trace
+    log_final = client.log_final_decision
+    
     def decorator(func):
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
             # Start trace
-            trace_id = client.start_trace(workflow_name)
+            trace_id = start(workflow_name, background=background)
             
             try:
                 # Run the function
                 result = func(*args, **kwargs)
+                outcome = result.get("outcome", "pending")
                 
-                # Log the decision
-                client.log_decision(
+                # Log the decision and complete the trace
+                log_final(
                     trace_id=trace_id,
                     agent_name=agent_name,
-                    outcome=result.get("outcome", "pending"),
+                    outcome=outcome,
                     confidence=result.get("confidence", 0.5),
                     reasoning=result.get("reasoning", ""),
-                    input_data={"args": str(args), "kwargs": str(kwargs)},
-                    output_data=result
+                    input_data={
+                        "args": [_safe_summary(a) for a in args],
+                        "kwargs": {k: _safe_summary(v) for k, v in kwargs.items()}
+                    },
+                    output_data=result,
+                    background=background
                 )
                 
-                # Complete trace
-                client.end_trace(trace_id, result.get("outcome", "pending"))
-                
                 return result
             except Exception as e:
-                # Log error
-                client.log_decision(
+                # Log error and complete the trace
+                log_final(
                     trace_id=trace_id,
                     agent_name=agent_name,
                     outcome="error",
                     confidence=0,
-                    reasoning=str(e)
+                    reasoning=str(e),
+                    background=background
                 )
-                client.end_trace(trace_id, "error")
                 raise
         
         return wrapper
@@ -1,8 +1,9 @@
-import { Pool } from 'pg';
+import { Pool, PoolClient } from 'pg';
 import { DecisionEvent, CreateEventRequest } from '@ledgermind/types';
 
 export class EventRepository {
-  constructor(private pool: Pool) {}
+  // Accepts a checked-out client so inserts can join a caller's transaction
+  constructor(private pool: Pool | PoolClient) {}
 
   async createEvent(
     tenantId: string,
@@ -244,6 +244,10 @@ export interface CreateEventRequest {
   
   policy_version_id?: string;
   metadata?: Record<string, any>;
+  
+  // Also complete the trace (final_outcome defaults to outcome)
+  end_trace?: boolean;
+  final_outcome?: OutcomeType;
 }
 
 export interface CreateTraceRequest {
@@ -28,7 +28,11 @@ pool.on('error', (err) => {
 app.use(cors({
   origin: process.env.CORS_ORIGINS?.split(',') || '*',
 }));
-app.use(express.json());
+// Batched events carry many payloads per request; allow a larger body there
+app.use('/api/events/batch', express.json({ limit: '10mb' }));
+// Decision payloads (input/output summaries) can be hundreds of KB; the limit
+// applies to the inflated body, so gzip-encoded requests count uncompressed
+app.use(express.json({ limit: process.env.JSON_BODY_LIMIT || '2mb' }));
 
 // Observability – instrument all requests
 app.use(metricsMiddleware(metrics));
@@ -1,5 +1,5 @@
 import { Router, Request, Response } from 'express';
-import { Pool } from 'pg';
+import { Pool, PoolClient } from 'pg';
 import { EventRepository, TraceRepository, VectorRepository, OverrideRepository } from '@ledgermind/db';
 import { z } from 'zod';
 import { EmbeddingService } from '../services/embedding';
@@ -8,6 +8,9 @@ import { HybridScorer } from '../scoring';
 import { QueryCache } from '../cache';
 import { IngestionQueue } from '../ingestion';
 
+// Raised inside a transaction to roll it back when an end_trace target is missing
+class TraceNotFoundError extends Error {}
+
 export function createRouter(pool: Pool, metrics?: MetricsRegistry): Router {
   const router = Router();
   
@@ -56,23 +59,52 @@ export function createRouter(pool: Pool, metrics?: MetricsRegistry): Router {
     }
   });
 
+  // Run `fn` on one pooled connection inside BEGIN/COMMIT (ROLLBACK on error)
+  const withTransaction = async <T>(fn: (client: PoolClient) => Promise<T>): Promise<T> => {
+    const client = await pool.connect();
+    try {
+      await client.query('BEGIN');
+      const result = await fn(client);
+      await client.query('COMMIT');
+      return result;
+    } catch (error) {
+      await client.query('ROLLBACK');
+      throw error;
+    } finally {
+      client.release();
+    }
+  };
+
+  // Mark a tenant's trace as finished with its final outcome (undefined if
+  // the tenant has no such trace)
+  const completeTrace = async (
+    db: Pool | PoolClient,
+    tenantId: string,
+    traceId: string,
+    finalOutcome: string
+  ) => {
+    const query = `
+      UPDATE trace_views 
+      SET final_outcome = $1, ended_at = NOW()
+      WHERE trace_id = $2 AND tenant_id = $3
+      RETURNING *
+    `;
+    const result = await db.query(query, [finalOutcome, traceId, tenantId]);
+    return result.rows[0];
+  };
+
   router.patch('/traces/:traceId', async (req: Request, res: Response) => {
     try {
+      const tenantId = (req as any).tenantId;
       const { traceId } = req.params;
       const { final_outcome } = req.body;
       
-      const query = `
-        UPDATE trace_views 
-        SET final_outcome = $1, ended_at = NOW()
-        WHERE trace_id = $2
-        RETURNING *
-      `;
-      const result = await pool.query(query, [final_outcome, traceId]);
+      const trace = await completeTrace(pool, tenantId, traceId as string, final_outcome);
       
-      if (result.rows.length === 0) {
+      if (!trace) {
         return res.status(404).json({ error: 'Trace not found' });
       }
-      res.json(result.rows[0]);
+      res.json(trace);
     } catch (error) {
       res.status(500).json({ error: (error as Error).message });
     }
@@ -121,46 +153,122 @@ export function createRouter(pool: Pool, metrics?: MetricsRegistry): Router {
     }
   });
 
+  // Queue embedding for a persisted decision event (async processing)
+  const queueEmbedding = (tenantId: string, body: any, event: any) => {
+    const jobId = `ingest_${event.event_id}`;
+    const accepted = ingestionQueue.submit({
+      id: jobId,
+      eventId: event.event_id,
+      tenantId,
+      embeddingInput: {
+        input: body.input_summary,
+        output: body.output_summary,
+        reasoning: body.reasoning,
+      },
+      vectorMetadata: {
+        decision_type: body.metadata?.decision_type,
+        workflow_name: body.metadata?.workflow_name,
+        outcome: body.outcome,
+        policy_version_id: body.policy_version_id,
+        timestamp: event.timestamp,
+      },
+    });
+
+    if (!accepted) {
+      // Queue full — backpressure. Event is saved, embedding deferred.
+      console.warn(`⚠️  Ingestion queue full, embedding deferred for event ${event.event_id}`);
+    }
+  };
+
   router.post('/events', async (req: Request, res: Response) => {
     try {
       const tenantId = (req as any).tenantId;
       
-      // Create event (synchronous — always persisted immediately)
+      // Create event (synchronous — always persisted immediately). For the
+      // final step of a trace, the insert and trace completion commit together.
       const stopDb = metrics?.dbQueryLatency.start();
-      const event = await eventRepo.createEvent(tenantId, req.body);
+      const event = req.body.end_trace
+        ? await withTransaction(async (client) => {
+            const created = await new EventRepository(client).createEvent(tenantId, req.body);
+            const trace = await completeTrace(client, tenantId, req.body.trace_id, req.body.final_outcome ?? req.body.outcome);
+            if (!trace) {
+              throw new TraceNotFoundError(req.body.trace_id);
+            }
+            return created;
+          })
+        : await eventRepo.createEvent(tenantId, req.body);
       stopDb?.();
 
       // If it's a decision event, queue embedding for async processing
       if (req.body.event_type === 'decision_made') {
-        const jobId = `ingest_${event.event_id}`;
-        const accepted = ingestionQueue.submit({
-          id: jobId,
-          eventId: event.event_id,
-          tenantId,
-          embeddingInput: {
-            input: req.body.input_summary,
-            output: req.body.output_summary,
-            reasoning: req.body.reasoning,
-          },
-          vectorMetadata: {
-            decision_type: req.body.metadata?.decision_type,
-            workflow_name: req.body.metadata?.workflow_name,
-            outcome: req.body.outcome,
-            policy_version_id: req.body.policy_version_id,
-            timestamp: event.timestamp,
-          },
-        });
-
-        if (!accepted) {
-          // Queue full — backpressure. Event is saved, embedding deferred.
-          console.warn(`⚠️  Ingestion queue full, embedding deferred for event ${event.event_id}`);
-        }
+        queueEmbedding(tenantId, req.body, event);
 
         // Invalidate cache for this tenant (new data incoming)
         queryCache.invalidateTenant(tenantId);
       }
 
       res.status(202).json(event);
+    } catch (error) {
+      if (error instanceof TraceNotFoundError) {
+        return res.status(404).json({ error: 'Trace not found' });
+      }
+      res.status(500).json({ error: (error as Error).message });
+    }
+  });
+
+  // Log many events in one round-trip (used by client-side buffering)
+  router.post('/events/batch', async (req: Request, res: Response) => {
+    try {
+      const tenantId = (req as any).tenantId;
+      const { events } = req.body;
+
+      if (!Array.isArray(events) || events.length === 0) {
+        return res.status(400).json({ error: 'events must be a non-empty array' });
+      }
+
+      if (events.length > 1000) {
+        return res.status(400).json({ error: 'Maximum batch size is 1000 events' });
+      }
+
+      // All-or-nothing, so a client retry after a failure can't duplicate rows
+      const stopDb = metrics?.dbQueryLatency.start();
+      const created = await withTransaction(async (client) => {
+        const txEventRepo = new EventRepository(client);
+        const rows = [];
+        for (const body of events) {
+          if (body.end_trace) {
+            // Like POST /events, skip the event if its trace doesn't exist,
+            // but report it per row rather than failing the batch
+            const trace = await completeTrace(client, tenantId, body.trace_id, body.final_outcome ?? body.outcome);
+            if (!trace) {
+              rows.push({ trace_id: body.trace_id, trace_completed: false });
+              continue;
+            }
+            const event = await txEventRepo.createEvent(tenantId, body);
+            rows.push({ ...event, trace_completed: true });
+          } else {
+            rows.push(await txEventRepo.createEvent(tenantId, body));
+          }
+        }
+        return rows;
+      });
+      stopDb?.();
+
+      // Queue embeddings only once the events are committed
+      let hasDecisions = false;
+      events.forEach((body: any, i: number) => {
+        if (body.event_type === 'decision_made' && created[i].trace_completed !== false) {
+          queueEmbedding(tenantId, body, created[i]);
+          hasDecisions = true;
+        }
+      });
+
+      // Invalidate once for the whole batch
+      if (hasDecisions) {
+        queryCache.invalidateTenant(tenantId);
+      }
+
+      res.status(202).json(created);
     } catch (error) {
       res.status(500).json({ error: (error as Error).message });
     }
@@ -302,6 +410,66 @@ export function createRouter(pool: Pool, metrics?: MetricsRegistry): Router {
     }
   });
 
+  /**
+   * Batch similarity: top-k raw vector matches for many queries at once.
+   * Accepts `input_contexts` (embedded here in one batch call) or precomputed
+   * `query_embeddings`. Results are not similarity-filtered unless
+   * `min_similarity` is given, so clients can threshold locally.
+   */
+  router.post('/similarity/query/batch', async (req: Request, res: Response) => {
+    try {
+      const tenantId = (req as any).tenantId;
+      const { input_contexts, query_embeddings, limit, min_similarity, workflow_name } = req.body;
+
+      const count = (query_embeddings ?? input_contexts)?.length;
+      if (!Array.isArray(query_embeddings ?? input_contexts) || count === 0) {
+        return res.status(400).json({ error: 'input_contexts or query_embeddings must be a non-empty array' });
+      }
+
+      if (count > 100) {
+        return res.status(400).json({ error: 'Maximum batch size is 100 queries' });
+      }
+
+      if (query_embeddings) {
+        const dimensions = embeddingService.getDimensions();
+        const bad = query_embeddings.findIndex(
+          (v: unknown) => !Array.isArray(v) || v.length !== dimensions
+        );
+        if (bad !== -1) {
+          return res.status(400).json({
+            error: `query_embeddings[${bad}] must be an array of ${dimensions} numbers`,
+          });
+        }
+      }
+
+      let embeddings: number[][] = query_embeddings;
+      if (!embeddings) {
+        const stopEmbed = metrics?.embeddingLatency.start();
+        embeddings = await embeddingService.generateBatch(
+          input_contexts.map((context: any) => ({ input: context }))
+        );
+        stopEmbed?.();
+      }
+
+      const stopRetrieval = metrics?.retrievalLatency.start();
+      const results = await Promise.all(
+        embeddings.map((embedding) =>
+          vectorRepo.findSimilar(tenantId, embedding, {
+            limit,
+            // -1 is the cosine floor, i.e. no server-side threshold
+            minSimilarity: min_similarity ?? -1,
+            workflowName: workflow_name,
+          })
+        )
+      );
+      stopRetrieval?.();
+
+      res.json({ results });
+    } catch (error) {
+      res.status(500).json({ error: (error as Error).message });
+    }
+  });
+
   // ==========================================================================
   // OVERRIDES
   // ==========================================================================
@@ -175,9 +175,12 @@ export interface EmbeddingConfig {
 
 export class EmbeddingService {
   private provider: EmbeddingProvider;
+  private dimensions: number;
 
   constructor(config?: EmbeddingConfig) {
     this.provider = this.createProvider(config);
+    // Must match the decision_vectors.embedding column (vector(1536))
+    this.dimensions = config?.dimensions || Number(process.env.EMBEDDING_DIMENSIONS) || 1536;
     console.log(`📊 Embedding provider: ${this.provider.name}`);
   }
 
@@ -214,6 +217,13 @@ export class EmbeddingService {
     return this.provider.name;
   }
 
+  /**
+   * Get the embedding dimension stored vectors (and query vectors) must have
+   */
+  getDimensions(): number {
+    return this.dimensions;
+  }
+
   /**
    * Generate embedding from decision context
    */